@@ -21,6 +21,7 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 # =============================================================================
 # CONFIGURATION
@@ -109,6 +110,15 @@ TEMP_LEVELS = {
 # Skip these txt files
 SKIP_TXT_FILES = {"case_summary.txt", "objection_language.txt", "preliminary_objections.txt"}
 
+# Discovery type from filename. Branches are tried in priority order at the
+# start of the name, so one match() call returns the first type that applies.
+DTYPE_RE = re.compile(
+    r"(?=.*(?:rfa|request.*admission))(?P<RFA>)"
+    r"|(?=.*(?:frog|form.*rog|form.*interrog))(?P<FROG>)"
+    r"|(?=.*(?:srog|spec.*rog|special.*interrog))(?P<SROG>)"
+    r"|(?=.*(?:rpd|rfp|request.*production))(?P<RPD>)"
+)
+
 
 # =============================================================================
 # FLEXIBLE PARSING
@@ -279,28 +289,50 @@ def parse_matrix_flexible(csv_path):
 
 def detect_discovery_type(filename):
     """Detect discovery type from filename."""
-    name_lower = filename.lower()
-    patterns = [
-        (r"rfa|request.*admission", "RFA"),
-        (r"frog|form.*rog|form.*interrog", "FROG"),
-        (r"srog|spec.*rog|special.*interrog", "SROG"),
-        (r"rpd|rfp|request.*production", "RPD"),
-    ]
-    for pattern, dtype in patterns:
-        if re.search(pattern, name_lower):
-            return dtype
-    return "DISCOVERY"
+    match = DTYPE_RE.match(filename.lower())
+    return match.lastgroup if match else "DISCOVERY"
 
 
 # =============================================================================
 # PROMPT GENERATION
 # =============================================================================
 
+@lru_cache(maxsize=8)
+def read_support_file(path, mtime_ns):
+    """Read a support file once per version; mtime_ns keys the cache so edits are picked up."""
+    return path.read_text(encoding="utf-8")
+
+
 def load_text_file(path):
     """Load text file if exists."""
-    if path.exists():
-        return path.read_text(encoding="utf-8")
-    return ""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return ""
+    return read_support_file(path, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def render_case_summary(path, mtime_ns):
+    """Case summary as embedded in the package, truncated once per file version."""
+    text = read_support_file(path, mtime_ns)
+    if len(text) <= 6000:
+        return text
+    return text[:6000] + "\n[...truncated...]"
+
+
+def load_case_summary():
+    """Truncated case summary, or "" if there is none."""
+    try:
+        st = CASE_SUMMARY_FILE.stat()
+    except FileNotFoundError:
+        return ""
+    return render_case_summary(CASE_SUMMARY_FILE, st.st_mtime_ns)
+
+
+def fenced_section(title, intro, body):
+    """One package section with body in a code fence, ending in a blank line once joined."""
+    return f"## {title}\n\n{intro}\n\n```\n{body}\n```\n\n---\n"
 
 
 def generate_prompt_package(discovery_path, matrix_path, explanation_temp, output_path):
@@ -310,7 +342,7 @@ def generate_prompt_package(discovery_path, matrix_path, explanation_temp, outpu
     matrix_data = parse_matrix_flexible(matrix_path)
     objection_lang = load_text_file(OBJECTION_LANG_FILE)
     preliminary_obj = load_text_file(PRELIMINARY_OBJ_FILE)
-    case_summary = load_text_file(CASE_SUMMARY_FILE) if explanation_temp >= 3 else ""
+    case_summary = load_case_summary() if explanation_temp >= 3 else ""
     
     lines = []
     
@@ -362,44 +394,24 @@ def generate_prompt_package(discovery_path, matrix_path, explanation_temp, outpu
     
     # === CASE SUMMARY (if high temp) ===
     if case_summary:
-        lines.append("## CASE SUMMARY")
-        lines.append("")
-        lines.append("Use for context when crafting case-specific reasoning.")
-        lines.append("")
-        lines.append("```")
-        lines.append(case_summary[:6000] + ("\n[...truncated...]" if len(case_summary) > 6000 else ""))
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        lines.append(fenced_section("CASE SUMMARY",
+                                    "Use for context when crafting case-specific reasoning.",
+                                    case_summary))
     
     # === PRELIMINARY OBJECTIONS (reference only) ===
     if preliminary_obj:
-        lines.append("## PRELIMINARY STATEMENT & GENERAL OBJECTIONS (Reference)")
-        lines.append("")
-        lines.append("These are incorporated by reference in the final document. Review to understand")
-        lines.append("what's already covered at the general level. Your drafted objections are the")
-        lines.append("**specific** objections that supplement these general ones.")
-        lines.append("")
-        lines.append("```")
-        lines.append(preliminary_obj)
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        lines.append(fenced_section(
+            "PRELIMINARY STATEMENT & GENERAL OBJECTIONS (Reference)",
+            "These are incorporated by reference in the final document. Review to understand\n"
+            "what's already covered at the general level. Your drafted objections are the\n"
+            "**specific** objections that supplement these general ones.",
+            preliminary_obj))
     
     # === APPROVED TEMPLATES ===
     if objection_lang:
-        lines.append("## APPROVED OBJECTION TEMPLATES")
-        lines.append("")
-        lines.append("Use these as your foundation. Each is numbered for reference.")
-        lines.append("")
-        lines.append("```")
-        lines.append(objection_lang)
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        lines.append(fenced_section("APPROVED OBJECTION TEMPLATES",
+                                    "Use these as your foundation. Each is numbered for reference.",
+                                    objection_lang))
     
     # === REQUESTS ===
     lines.append(f"## REQUESTS TO DRAFT ({len(matrix_data)} total)")
@@ -22,9 +22,13 @@ Usage:
 
 import argparse
 import csv
+import mmap
+import os
 import re
 import sys
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 
 # =============================================================================
@@ -68,11 +72,25 @@ COLUMN_ALIASES = {
     "Def-Overbroad": ["def-overbroad", "definition overbroad"],
 }
 
-# Build reverse lookup
-ALIAS_TO_CANONICAL = {}
-for canonical, aliases in COLUMN_ALIASES.items():
-    for alias in aliases:
-        ALIAS_TO_CANONICAL[alias.lower().strip()] = canonical
+# Column names that identify the request number and notes columns
+REQUEST_COLUMN_NAMES = frozenset({"request", "req", "no", "no.", "number", "request no",
+                                  "request no.", "interrogatory", "rog", "rfa", "rpd"})
+NOTES_COLUMN_NAMES = frozenset({"notes", "comments", "note", "comment", "remarks"})
+
+# One lookup table for matrix headers: header key -> (role, canonical).
+# Request and notes names are added last so they win over any objection alias.
+COLUMN_KINDS = {
+    alias.casefold(): ("objection", sys.intern(canonical))
+    for canonical, aliases in COLUMN_ALIASES.items()
+    for alias in aliases
+}
+COLUMN_KINDS.update((name, ("request", None)) for name in REQUEST_COLUMN_NAMES)
+COLUMN_KINDS.update((name, ("notes", None)) for name in NOTES_COLUMN_NAMES)
+
+# Cell values that mark an objection without adding notes. The common
+# spellings are listed as typed so most cells skip the upper() fallback.
+TRUE_MARKERS = frozenset({"X", "YES", "Y", "1", "TRUE"})
+TRUE_MARKER_SPELLINGS = TRUE_MARKERS | {"x", "yes", "y", "true", "Yes", "True"}
 
 # Template numbers matching objection_language.txt
 CANONICAL_TO_TEMPLATE = {
@@ -95,145 +113,320 @@ TEMP_LEVELS = {
 
 SKIP_TXT_FILES = {"case_summary.txt", "objection_language.txt", "preliminary_objections.txt"}
 
+# Case summaries longer than this are truncated in the package
+CASE_SUMMARY_LIMIT = 6000
+
+# Fixed blocks of the prompt package, filled with str.format
+PACKAGE_HEADER = """\
+# OBJECTION DRAFTING PACKAGE: {dtype}
+**Generated:** {generated}
+**Working Directory:** `{base_dir}`
+**Discovery File:** `{discovery}`
+**Matrix File:** `{matrix}`
+**Explanation Level:** {temp_name}
+
+---
+
+## SCOPE
+
+**Draft OBJECTIONS ONLY.** Do not draft substantive responses.
+
+For each discovery request below, draft the specific objection prose based on
+the marked objection types. The attorney will separately handle substantive responses.
+
+---
+
+## DRAFTING RULES
+
+1. **Use the APPROVED TEMPLATES** as your foundation (see below)
+2. **Fill in [SPECIFY] placeholders** with terms from the request
+3. **Combine multiple objections** into flowing prose—no bullets in output
+4. **If no objections marked**, output: `No specific objections.`
+
+### Explanation Depth
+**{temp_label}:** {temp_desc}
+
+{depth_guidance}
+---
+
+"""
+
+FENCED_SECTION = """\
+## {title}
+
+{intro}
+
+```
+{body}
+```
+
+---
+
+"""
+
+PRELIMINARY_INTRO = """\
+These are incorporated by reference in the final document. Review to understand
+what's already covered at the general level. Your drafted objections are the
+**specific** objections that supplement these general ones."""
+
+DRAFT_BLOCK = """\
+**DRAFT:**
+```
+[YOUR OBJECTION PROSE HERE]
+```
+
+---
+
+"""
+
+OUTPUT_FORMAT = """\
+## OUTPUT FORMAT
+
+For each request, provide ONLY the objection prose. Example:
+
+```
+### {dtype} NO. 1.1
+
+Responding Party objects to this interrogatory on the grounds that it is vague
+and ambiguous as to the term "INCIDENT," which is defined to span over a decade
+of project history. Responding Party further objects on the grounds that the
+interrogatory is overbroad and unduly burdensome in scope.
+```
+
+Do NOT include:
+- Incorporation language (attorney adds this)
+- Substantive responses (attorney handles separately)
+- "Subject to and without waiving..." transitions
+"""
+
+# Discovery request patterns, tried in order. Each family is an ANCHOR that
+# splits the text into one chunk per request, and a HEAD matched at the start
+# of each chunk to pull out the request number; the rest of the chunk is the text.
+FORM_ROG_ANCHOR = re.compile(r'Form\s+Interrogatory\s+No\.', re.IGNORECASE)
+FORM_ROG_HEAD = re.compile(r'\s*(\d+\.?\d*)\s*[:\n]?\s*["\']?')
+RFA_ANCHOR = re.compile(r'REQUEST\s+FOR\s+ADMISSION\s+NO\.', re.IGNORECASE)
+RPD_ANCHOR = re.compile(r'REQUEST\s+FOR\s+PRODUCTION', re.IGNORECASE)
+RPD_HEAD = re.compile(r'\s+(?:OF\s+DOCUMENTS\s+)?NO\.\s*(\d+)[:\s]+', re.IGNORECASE)
+# Same language as (?:SPECIAL\s+)?INTERROGATORY\s+NO\. but starting with a
+# character class, so the search can skip ahead instead of trying the
+# optional prefix at every position
+SROG_ANCHOR = re.compile(r'[SI](?:(?<=[Ss])PECIAL\s+INTERROGATORY|(?<=[Ii])NTERROGATORY)\s+NO\.',
+                         re.IGNORECASE)
+NUMBERED_HEAD = re.compile(r'\s*(\d+)[:\s]+')
+# Bare numbers start a line. Anchoring on the newline itself, rather than
+# ^ under MULTILINE, lets the search jump between newlines instead of
+# testing every position. The first line has no newline before it, so this
+# family also treats the text ahead of the first anchor as a chunk.
+BARE_ANCHOR = re.compile(r'\n(?=\d+\.\d+\s)')
+BARE_HEAD = re.compile(r'(\d+\.\d+)\s+')
+
+# Separators ignored when matching discovery and matrix file names
+STEM_STRIP_TABLE = str.maketrans("", "", "_- ")
+
+# Discovery type from filename. Branches are tried in priority order at the
+# start of the name, so one match() call returns the first type that applies.
+DTYPE_RE = re.compile(
+    r"(?=.*(?:rfa|request.*admission))(?P<RFA>)"
+    r"|(?=.*(?:frog|form.*rog|form.*interrog))(?P<FROG>)"
+    r"|(?=.*(?:srog|spec.*rog|special.*interrog))(?P<SROG>)"
+    r"|(?=.*(?:rpd|rfp|request.*production))(?P<RPD>)"
+)
+
 
 # =============================================================================
 # PARSING FUNCTIONS
 # =============================================================================
 
-def normalize_column_name(col_name):
-    if not col_name:
-        return None
-    lower = col_name.strip().lower()
-    return ALIAS_TO_CANONICAL.get(lower, col_name)
+def column_key(col_name):
+    """Casefold a header and collapse whitespace runs, so "Vague  &\tAmbiguous" finds its alias."""
+    return " ".join(col_name.casefold().split())
 
-def is_notes_column(col_name):
+def classify_column(col_name):
+    """Classify a matrix header as (kind, canonical_name); kind is None for a blank header."""
     if not col_name:
-        return False
-    return col_name.strip().lower() in ("notes", "comments", "note", "comment", "remarks")
+        return (None, None)
+    # Unknown headers become their own objection name; intern so every matrix shares one copy
+    return (COLUMN_KINDS.get(column_key(col_name))
+            or ("objection", sys.intern(col_name)))
 
 def is_request_column(col_name):
-    if not col_name:
-        return False
-    lower = col_name.strip().lower()
-    return lower in ("request", "req", "no", "no.", "number", "request no", 
-                     "request no.", "interrogatory", "rog", "rfa", "rpd")
+    return classify_column(col_name)[0] == "request"
 
 def detect_discovery_type(filename):
-    name_lower = filename.lower()
-    patterns = [
-        (r"rfa|request.*admission", "RFA"),
-        (r"frog|form.*rog|form.*interrog", "FROG"),
-        (r"srog|spec.*rog|special.*interrog", "SROG"),
-        (r"rpd|rfp|request.*production", "RPD"),
-    ]
-    for pattern, dtype in patterns:
-        if re.search(pattern, name_lower):
-            return dtype
-    return "DISCOVERY"
+    match = DTYPE_RE.match(filename.lower())
+    return match.lastgroup if match else "DISCOVERY"
+
+def split_requests(content, anchor, head, from_start=False):
+    """Yield (request_num, raw_text) for each anchored chunk whose header matches."""
+    # Chunks run between anchor matches and are never copied out whole; with
+    # from_start the text ahead of the first anchor is a chunk too
+    start = 0 if from_start else None
+    for match in chain(anchor.finditer(content), (None,)):
+        end = match.start() if match else len(content)
+        if start is not None:
+            found = head.match(content, start, end)
+            if found:
+                yield found.group(1), content[found.end():end]
+        start = match.end() if match else None
+
+def keywords_present(content, keywords, block_size=1 << 20):
+    """Lowercase keywords found in ASCII content, lowering one block at a time."""
+    # Blocks overlap so a keyword is never cut in two
+    wanted = set(keywords)
+    found = set()
+    overlap = max(map(len, wanted)) - 1
+    for pos in range(0, len(content), block_size):
+        block = content[pos:pos + block_size + overlap].lower()
+        found.update(k for k in wanted - found if k in block)
+        if found == wanted:
+            break
+    return found
+
+def read_discovery_text(filepath):
+    """Read a discovery file like read_text(), but decode straight from a memory map."""
+    with filepath.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, "utf-8")
+            has_cr = mm.find(b"\r") != -1
+    # Universal newlines, as text-mode reads would give
+    if has_cr:
+        content = content.replace("\r\n", "\n")
+        if "\r" in content:
+            content = content.replace("\r", "\n")
+    return content
+
+def clean_form_rog_text(body):
+    """Form interrogatory text may be quoted; empty ones are dropped."""
+    text = body.rstrip()
+    if text[-1:] in ('"', "'"):
+        text = text[:-1]
+    return text.strip().strip('"\'') or None
+
+def clean_request_text(body):
+    return body.strip()
+
+def clean_bare_text(body):
+    """Bare numbers also match stray figures, so short text is dropped."""
+    text = body.strip()
+    return text if len(text) > 20 else None
+
+# Request families in the order they are tried; the first that yields any
+# request wins. keyword is a lowercase word every header of the family
+# contains (None: always try), clean turns a raw body into the request
+# text, or None to drop it, and from_start is passed to split_requests.
+REQUEST_FAMILIES = (
+    # Form Interrogatory No. X.X (optionally quoted)
+    ("interrogatory", FORM_ROG_ANCHOR, FORM_ROG_HEAD, clean_form_rog_text, False),
+    # REQUEST FOR ADMISSION NO. X
+    ("admission", RFA_ANCHOR, NUMBERED_HEAD, clean_request_text, False),
+    # REQUEST FOR PRODUCTION NO. X
+    ("production", RPD_ANCHOR, RPD_HEAD, clean_request_text, False),
+    # INTERROGATORY NO. X
+    ("interrogatory", SROG_ANCHOR, NUMBERED_HEAD, clean_request_text, False),
+    # Bare X.X at start of line
+    (None, BARE_ANCHOR, BARE_HEAD, clean_bare_text, True),
+)
+
+# Keywords the prefilter in parse_discovery_file looks for
+FAMILY_KEYWORDS = {keyword for keyword, *_ in REQUEST_FAMILIES if keyword}
 
 def parse_discovery_file(filepath):
     """Parse discovery requests. Returns {request_num: text}."""
-    content = filepath.read_text(encoding="utf-8")
-    requests = {}
-    
-    # Pattern 1: Form Interrogatory No. X.X
-    for match in re.finditer(
-        r'Form\s+Interrogatory\s+No\.\s*(\d+\.?\d*)\s*[:\n]?\s*["\']?(.*?)["\']?\s*(?=Form\s+Interrogatory\s+No\.|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        num = match.group(1).strip()
-        text = match.group(2).strip().strip('"\'')
-        if text:
-            requests[num] = text
-    if requests:
-        return requests
+    content = read_discovery_text(filepath)
     
-    # Pattern 2: REQUEST FOR ADMISSION NO. X
-    for match in re.finditer(
-        r'REQUEST\s+FOR\s+ADMISSION\s+NO\.\s*(\d+)[:\s]+(.*?)(?=REQUEST\s+FOR\s+ADMISSION\s+NO\.|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        requests[match.group(1)] = match.group(2).strip()
-    if requests:
-        return requests
+    # A substring test is far cheaper than a regex pass, so families whose
+    # keyword never appears are skipped. Only trusted for ASCII text, where
+    # lower() agrees with IGNORECASE matching.
+    present = keywords_present(content, FAMILY_KEYWORDS) if content.isascii() else FAMILY_KEYWORDS
     
-    # Pattern 3: REQUEST FOR PRODUCTION NO. X
-    for match in re.finditer(
-        r'REQUEST\s+FOR\s+PRODUCTION\s+(?:OF\s+DOCUMENTS\s+)?NO\.\s*(\d+)[:\s]+(.*?)(?=REQUEST\s+FOR\s+PRODUCTION|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        requests[match.group(1)] = match.group(2).strip()
-    if requests:
-        return requests
-    
-    # Pattern 4: INTERROGATORY NO. X
-    for match in re.finditer(
-        r'(?:SPECIAL\s+)?INTERROGATORY\s+NO\.\s*(\d+)[:\s]+(.*?)(?=(?:SPECIAL\s+)?INTERROGATORY\s+NO\.|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        requests[match.group(1)] = match.group(2).strip()
-    if requests:
-        return requests
-    
-    # Pattern 5: Bare X.X at start of line
-    for match in re.finditer(r'^(\d+\.\d+)\s+(.*?)(?=^\d+\.\d+\s|\Z)', content, re.MULTILINE | re.DOTALL):
-        text = match.group(2).strip()
-        if len(text) > 20:
-            requests[match.group(1)] = text
-    
-    return requests
+    for keyword, anchor, head, clean, from_start in REQUEST_FAMILIES:
+        if keyword and keyword not in present:
+            continue
+        requests = {}
+        for num, body in split_requests(content, anchor, head, from_start):
+            request_text = clean(body)
+            if request_text is not None:
+                requests[num] = request_text
+        if requests:
+            return requests
+    return {}
 
 def parse_matrix_cell(cell_value):
     """Returns (should_use: bool, notes: str or None)."""
     if not cell_value:
         return (False, None)
-    val = str(cell_value).strip()
+    val = cell_value.strip() if isinstance(cell_value, str) else str(cell_value).strip()
     if not val:
         return (False, None)
-    if ";" in val:
-        parts = val.split(";", 1)
-        notes = parts[1].strip() if len(parts) > 1 else None
-        return (True, notes)
-    if val.upper() in ("X", "YES", "Y", "1", "TRUE"):
+    semi = val.find(";")
+    if semi >= 0:
+        return (True, val[semi + 1:].strip())
+    if val in TRUE_MARKER_SPELLINGS or val.upper() in TRUE_MARKERS:
         return (True, None)
     return (True, val)
 
+def make_objection_parser(objection_cols):
+    """Build the row -> objections function for [(column_index, canonical)] columns."""
+    obj_indices = [idx for idx, _ in objection_cols]
+    obj_meta = [(canonical, CANONICAL_TO_TEMPLATE.get(canonical, "?"))
+                for _, canonical in objection_cols]
+    # One C-level call pulls every objection cell out of a row
+    if len(obj_indices) > 1:
+        get_cells = itemgetter(*obj_indices)
+    else:
+        get_cells = lambda row: tuple(row[idx] for idx in obj_indices)
+    
+    def parse_objections(row):
+        objections = []
+        for cell, (canonical, tpl) in zip(get_cells(row), obj_meta):
+            # Most cells are empty; skip them without calling parse_matrix_cell
+            if cell:
+                should_use, cell_notes = parse_matrix_cell(cell)
+                if should_use:
+                    objections.append((canonical, tpl, cell_notes))
+        return objections
+    
+    return parse_objections
+
 def parse_matrix(csv_path):
     """Parse CSV matrix. Returns list of {request, objections, notes_col}."""
     rows = []
     with open(csv_path, newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
         
-        request_col = None
-        notes_col = None
+        # Resolve column roles once; rows are then read by position. A
+        # repeated header name reads its last column, as in smart_sync.
+        col_index = {col: idx for idx, col in enumerate(fieldnames)}
+        request_idx = None
+        notes_idx = None
         objection_cols = []
         
         for col in fieldnames:
-            if is_request_column(col):
-                request_col = col
-            elif is_notes_column(col):
-                notes_col = col
-            else:
-                canonical = normalize_column_name(col)
-                if canonical:
-                    objection_cols.append((col, canonical))
+            role, canonical = classify_column(col)
+            if role == "request":
+                request_idx = col_index[col]
+            elif role == "notes":
+                notes_idx = col_index[col]
+            elif role == "objection":
+                objection_cols.append((col_index[col], canonical))
         
-        if not request_col:
+        if request_idx is None:
             raise ValueError(f"No request column found. Columns: {fieldnames}")
         
+        parse_objections = make_objection_parser(objection_cols)
+        width = len(fieldnames)
         for row in reader:
-            req_num = (row.get(request_col) or "").strip()
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            req_num = row[request_idx].strip()
             if not req_num:
                 continue
             
-            objections = []
-            for orig_col, canonical in objection_cols:
-                should_use, cell_notes = parse_matrix_cell(row.get(orig_col, ""))
-                if should_use:
-                    objections.append((canonical, cell_notes))
-            
-            notes_val = (row.get(notes_col) or "").strip() if notes_col else ""
+            objections = parse_objections(row)
+            notes_val = row[notes_idx].strip() if notes_idx is not None else ""
             rows.append({"request": req_num, "objections": objections, "notes_col": notes_val})
     
     return rows
@@ -246,214 +439,186 @@ def parse_matrix(csv_path):
 def find_discovery_files():
     return [f for f in BASE_DIR.glob("*.txt") if f.name.lower() not in SKIP_TXT_FILES]
 
+def read_csv_header(path):
+    """Return the header row of a CSV, reading only its first line when unquoted."""
+    with open(path, newline="", encoding="utf-8-sig") as csvfile:
+        line = csvfile.readline()
+        # Only quoted headers need the csv module
+        if '"' not in line:
+            return tuple(line.rstrip("\r\n").split(",")) if line.strip("\r\n") else ()
+        return tuple(next(csv.reader(chain((line,), csvfile)), ()))
+
 def find_matrix_files():
     files = []
     for f in BASE_DIR.glob("*.csv"):
         try:
-            with open(f, newline="", encoding="utf-8-sig") as csvfile:
-                reader = csv.DictReader(csvfile)
-                if reader.fieldnames and any(is_request_column(c) for c in reader.fieldnames):
-                    files.append(f)
+            header = read_csv_header(f)
+            if any(is_request_column(c) for c in header):
+                files.append(f)
         except:
             continue
     return files
 
+def clean_stem(path):
+    """Casefolded file stem with separators removed, for name matching."""
+    return path.stem.casefold().translate(STEM_STRIP_TABLE)
+
 def auto_match_pairs():
+    """Auto-match discovery files with matrix files, by the same rule as smart_sync."""
     txt_files = find_discovery_files()
     csv_files = find_matrix_files()
+    
+    # Clean each name once rather than once per comparison
+    csv_info = []
+    for csv_f in csv_files:
+        csv_base = clean_stem(csv_f)
+        csv_info.append((csv_f, csv_base, set(csv_base)))
+    
     pairs = []
-    matched = set()
+    matched_csvs = set()
     
     for txt in txt_files:
-        txt_base = txt.stem.lower().replace("_", "").replace("-", "").replace(" ", "")
-        best_match, best_score = None, 0
+        txt_base = clean_stem(txt)
+        txt_chars = set(txt_base)
+        # No matrix can score higher than sharing every character plus the substring bonus
+        max_score = len(txt_chars) + 10
+        best_match = None
+        best_score = 0
         
-        for csv_f in csv_files:
-            if csv_f in matched:
+        for csv_f, csv_base, csv_chars in csv_info:
+            if csv_f in matched_csvs:
                 continue
-            csv_base = csv_f.stem.lower().replace("_", "").replace("-", "").replace(" ", "")
-            score = len(set(txt_base) & set(csv_base))
+            
+            score = len(txt_chars & csv_chars)
             if txt_base in csv_base or csv_base in txt_base:
                 score += 10
+            
             if score > best_score:
-                best_score, best_match = score, csv_f
+                best_score = score
+                best_match = csv_f
+                if best_score >= max_score:
+                    break
         
         if best_match and best_score > 3:
             pairs.append((txt, best_match))
-            matched.add(best_match)
+            matched_csvs.add(best_match)
     
     return pairs
 
 def load_text_file(path):
     return path.read_text(encoding="utf-8") if path.exists() else ""
 
+def render_case_summary(path):
+    """Case summary as embedded in the package, truncated to CASE_SUMMARY_LIMIT."""
+    text = path.read_text(encoding="utf-8")
+    if len(text) <= CASE_SUMMARY_LIMIT:
+        return text
+    return text[:CASE_SUMMARY_LIMIT] + "\n[...truncated...]"
+
 
 # =============================================================================
 # PROMPT GENERATION
 # =============================================================================
 
-def generate_prompt_package(discovery_path, matrix_path, explanation_temp, output_path):
+def load_support_files(explanation_temp):
+    """Read the support files shared by every package at this explanation level."""
+    case_summary = ""
+    if explanation_temp >= 3 and CASE_SUMMARY_FILE.exists():
+        case_summary = render_case_summary(CASE_SUMMARY_FILE)
+    return {
+        "objection_lang": load_text_file(OBJECTION_LANG_FILE),
+        "preliminary_obj": load_text_file(PRELIMINARY_OBJ_FILE),
+        "case_summary": case_summary,
+    }
+
+def generate_prompt_package(discovery_path, matrix_path, explanation_temp, output_path, support=None):
     """Generate prompt package for OBJECTIONS ONLY."""
     dtype = detect_discovery_type(discovery_path.name)
     requests = parse_discovery_file(discovery_path)
     matrix_data = parse_matrix(matrix_path)
-    objection_lang = load_text_file(OBJECTION_LANG_FILE)
-    preliminary_obj = load_text_file(PRELIMINARY_OBJ_FILE)
-    case_summary = load_text_file(CASE_SUMMARY_FILE) if explanation_temp >= 3 else ""
-    
-    lines = []
-    
-    # === HEADER ===
-    lines.append(f"# OBJECTION DRAFTING PACKAGE: {dtype}")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Working Directory:** `{BASE_DIR}`")
-    lines.append(f"**Discovery File:** `{discovery_path.name}`")
-    lines.append(f"**Matrix File:** `{matrix_path.name}`")
-    lines.append(f"**Explanation Level:** {TEMP_LEVELS[explanation_temp][0]}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # === SCOPE ===
-    lines.append("## SCOPE")
-    lines.append("")
-    lines.append("**Draft OBJECTIONS ONLY.** Do not draft substantive responses.")
-    lines.append("")
-    lines.append("For each discovery request below, draft the specific objection prose based on")
-    lines.append("the marked objection types. The attorney will separately handle substantive responses.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # === INSTRUCTIONS ===
-    lines.append("## DRAFTING RULES")
-    lines.append("")
-    lines.append("1. **Use the APPROVED TEMPLATES** as your foundation (see below)")
-    lines.append("2. **Fill in [SPECIFY] placeholders** with terms from the request")
-    lines.append("3. **Combine multiple objections** into flowing prose—no bullets in output")
-    lines.append("4. **If no objections marked**, output: `No specific objections.`")
-    lines.append("")
+    # main passes support so several packages share one read of the files
+    if support is None:
+        support = load_support_files(explanation_temp)
+    objection_lang = support["objection_lang"]
+    preliminary_obj = support["preliminary_obj"]
+    case_summary = support["case_summary"]
     
-    # Explanation depth guidance
-    lines.append("### Explanation Depth")
     temp_name, temp_desc = TEMP_LEVELS[explanation_temp]
-    lines.append(f"**{temp_name.upper()}:** {temp_desc}")
-    lines.append("")
     if explanation_temp == 0:
-        lines.append("Use template language exactly. Do not add reasoning.")
-    elif explanation_temp >= 1:
-        lines.append("You may add brief case-specific reasoning where cell notes or the Notes column provide guidance.")
+        depth_guidance = "Use template language exactly. Do not add reasoning.\n"
+    else:
+        depth_guidance = ("You may add brief case-specific reasoning where cell notes "
+                          "or the Notes column provide guidance.\n")
     if explanation_temp >= 3:
-        lines.append("Draw from the Case Summary for strategic context.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # === CASE SUMMARY (if high temp) ===
-    if case_summary:
-        lines.append("## CASE SUMMARY")
-        lines.append("")
-        lines.append("Use for context when crafting case-specific reasoning.")
-        lines.append("")
-        lines.append("```")
-        lines.append(case_summary[:6000] + ("\n[...truncated...]" if len(case_summary) > 6000 else ""))
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-    
-    # === PRELIMINARY OBJECTIONS (reference only) ===
-    if preliminary_obj:
-        lines.append("## PRELIMINARY STATEMENT & GENERAL OBJECTIONS (Reference)")
-        lines.append("")
-        lines.append("These are incorporated by reference in the final document. Review to understand")
-        lines.append("what's already covered at the general level. Your drafted objections are the")
-        lines.append("**specific** objections that supplement these general ones.")
-        lines.append("")
-        lines.append("```")
-        lines.append(preliminary_obj)
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-    
-    # === APPROVED TEMPLATES ===
-    if objection_lang:
-        lines.append("## APPROVED OBJECTION TEMPLATES")
-        lines.append("")
-        lines.append("Use these as your foundation. Each is numbered for reference.")
-        lines.append("")
-        lines.append("```")
-        lines.append(objection_lang)
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        depth_guidance += "Draw from the Case Summary for strategic context.\n"
     
-    # === REQUESTS ===
-    lines.append(f"## REQUESTS TO DRAFT ({len(matrix_data)} total)")
-    lines.append("")
-    
-    for item in matrix_data:
-        req_num = item["request"]
-        objections = item["objections"]
-        notes_col = item["notes_col"]
-        req_text = requests.get(req_num, "[REQUEST TEXT NOT FOUND]")
+    # Stream straight to disk rather than joining the whole package in memory;
+    # each fixed block goes out in a single write
+    with output_path.open("w", encoding="utf-8") as out:
+        out.write(PACKAGE_HEADER.format(
+            dtype=dtype,
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            base_dir=BASE_DIR,
+            discovery=discovery_path.name,
+            matrix=matrix_path.name,
+            temp_name=temp_name,
+            temp_label=temp_name.upper(),
+            temp_desc=temp_desc,
+            depth_guidance=depth_guidance,
+        ))
         
-        lines.append(f"### {dtype} NO. {req_num}")
-        lines.append("")
-        lines.append("**REQUEST:**")
-        lines.append(f"> {req_text[:800]}{'...' if len(req_text) > 800 else ''}")
-        lines.append("")
+        if case_summary:
+            out.write(FENCED_SECTION.format(
+                title="CASE SUMMARY",
+                intro="Use for context when crafting case-specific reasoning.",
+                body=case_summary))
         
-        if objections:
-            obj_display = []
-            for canonical, cell_notes in objections:
-                tpl = CANONICAL_TO_TEMPLATE.get(canonical, "?")
-                if cell_notes and explanation_temp >= 1:
-                    obj_display.append(f"- {canonical} (#{tpl}): *{cell_notes}*")
-                else:
-                    obj_display.append(f"- {canonical} (#{tpl})")
-            lines.append("**OBJECTIONS TO DRAFT:**")
-            lines.extend(obj_display)
-        else:
-            lines.append("**OBJECTIONS TO DRAFT:** None")
-        lines.append("")
+        # Reference only
+        if preliminary_obj:
+            out.write(FENCED_SECTION.format(
+                title="PRELIMINARY STATEMENT & GENERAL OBJECTIONS (Reference)",
+                intro=PRELIMINARY_INTRO,
+                body=preliminary_obj))
         
-        if notes_col and explanation_temp >= 2:
-            lines.append(f"**NOTES:** {notes_col}")
-            lines.append("")
+        if objection_lang:
+            out.write(FENCED_SECTION.format(
+                title="APPROVED OBJECTION TEMPLATES",
+                intro="Use these as your foundation. Each is numbered for reference.",
+                body=objection_lang))
         
-        lines.append("**DRAFT:**")
-        lines.append("```")
-        lines.append("[YOUR OBJECTION PROSE HERE]")
-        lines.append("```")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-    
-    # === OUTPUT FORMAT ===
-    lines.append("## OUTPUT FORMAT")
-    lines.append("")
-    lines.append("For each request, provide ONLY the objection prose. Example:")
-    lines.append("")
-    lines.append("```")
-    lines.append(f"### {dtype} NO. 1.1")
-    lines.append("")
-    lines.append("Responding Party objects to this interrogatory on the grounds that it is vague")
-    lines.append("and ambiguous as to the term \"INCIDENT,\" which is defined to span over a decade")
-    lines.append("of project history. Responding Party further objects on the grounds that the")
-    lines.append("interrogatory is overbroad and unduly burdensome in scope.")
-    lines.append("```")
-    lines.append("")
-    lines.append("Do NOT include:")
-    lines.append("- Incorporation language (attorney adds this)")
-    lines.append("- Substantive responses (attorney handles separately)")
-    lines.append("- \"Subject to and without waiving...\" transitions")
-    lines.append("")
+        # === REQUESTS ===
+        out.write(f"## REQUESTS TO DRAFT ({len(matrix_data)} total)\n\n")
+        
+        with_obj = 0
+        for item in matrix_data:
+            req_num = item["request"]
+            objections = item["objections"]
+            notes_col = item["notes_col"]
+            req_text = requests.get(req_num, "[REQUEST TEXT NOT FOUND]")
+            
+            parts = [f"### {dtype} NO. {req_num}\n\n**REQUEST:**\n"
+                     f"> {req_text[:800]}{'...' if len(req_text) > 800 else ''}\n\n"]
+            if objections:
+                with_obj += 1
+                parts.append("**OBJECTIONS TO DRAFT:**\n")
+                for canonical, tpl, cell_notes in objections:
+                    if cell_notes and explanation_temp >= 1:
+                        parts.append(f"- {canonical} (#{tpl}): *{cell_notes}*\n")
+                    else:
+                        parts.append(f"- {canonical} (#{tpl})\n")
+            else:
+                parts.append("**OBJECTIONS TO DRAFT:** None\n")
+            parts.append("\n")
+            
+            if notes_col and explanation_temp >= 2:
+                parts.append(f"**NOTES:** {notes_col}\n\n")
+            
+            parts.append(DRAFT_BLOCK)
+            out.write("".join(parts))
+        
+        out.write(OUTPUT_FORMAT.format(dtype=dtype))
     
-    output_path.write_text("\n".join(lines), encoding="utf-8")
-    return len(matrix_data), sum(1 for m in matrix_data if m["objections"])
+    return len(matrix_data), with_obj
 
 
 # =============================================================================
@@ -515,6 +680,8 @@ Examples:
     print(f"Explanation level: {args.temp} ({TEMP_LEVELS[args.temp][0]})")
     print(f"Processing {len(pairs)} pair(s)...\n")
     
+    support = load_support_files(args.temp)
+    
     for disc_path, matrix_path in pairs:
         dtype = detect_discovery_type(disc_path.name)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -522,7 +689,7 @@ Examples:
         output_path = BASE_DIR / output_name
         
         try:
-            total, with_obj = generate_prompt_package(disc_path, matrix_path, args.temp, output_path)
+            total, with_obj = generate_prompt_package(disc_path, matrix_path, args.temp, output_path, support)
             print(f"  ✓ {output_name}: {total} requests, {with_obj} with objections")
         except Exception as e:
             print(f"  ✗ {disc_path.name}: {e}")
@@ -14,15 +14,23 @@ Commands:
   --status            Show baseline info
   --history           Show audit trail
 
+Add --pretty to --init, --diff, --apply or --snapshot to save
+objection_state.json indented (it is compact by default).
+
 Works with any discovery/matrix file pairs in the folder.
 """
 
 import csv
 import hashlib
 import json
+import mmap
+import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
 # =============================================================================
@@ -34,19 +42,177 @@ STATE_FILE = BASE_DIR / "objection_state.json"
 OBJECTION_LANG_FILE = BASE_DIR / "objection_language.txt"
 CASE_SUMMARY_FILE = BASE_DIR / "case_summary.txt"
 EDITS_PACKAGE = BASE_DIR / "edits_prompt_package.md"
+HISTORY_LOG = BASE_DIR / "history.log.jsonl"
+
+# History entries kept in the state file; older ones move to HISTORY_LOG
+HISTORY_LIMIT = 100
+
+# Indent objection_state.json for reading and diffing (set by --pretty)
+PRETTY_STATE = False
 
 # Files to skip when scanning for discovery files
 SKIP_TXT_FILES = {"case_summary.txt", "objection_language.txt", "preliminary_objections.txt"}
 
+# Matrix header roles, keyed by column_key() of the header
+COLUMN_KINDS = {name: "request" for name in (
+    "request", "req", "no", "no.", "number", "request no",
+    "request no.", "interrogatory", "rog", "rfa", "rpd")}
+COLUMN_KINDS.update((name, "notes") for name in (
+    "notes", "comments", "note", "comment", "remarks"))
+
+# Cell values that mark an objection without adding notes. The common
+# spellings are listed as typed so most cells skip the upper() fallback.
+TRUE_MARKERS = frozenset({"X", "YES", "Y", "1", "TRUE"})
+TRUE_MARKER_SPELLINGS = TRUE_MARKERS | {"x", "yes", "y", "true", "Yes", "True"}
+
+# Separators ignored when matching discovery and matrix file names
+STEM_STRIP_TABLE = str.maketrans("", "", "_- ")
+
+# Discovery request patterns, tried in order. Each family is an ANCHOR that
+# splits the text into one chunk per request, and a HEAD matched at the start
+# of each chunk to pull out the request number; the rest of the chunk is the text.
+FORM_ROG_ANCHOR = re.compile(r'Form\s+Interrogatory\s+No\.', re.IGNORECASE)
+FORM_ROG_HEAD = re.compile(r'\s*(\d+\.?\d*)\s*[:\n]?\s*["\']?')
+RFA_ANCHOR = re.compile(r'REQUEST\s+FOR\s+ADMISSION\s+NO\.', re.IGNORECASE)
+RPD_ANCHOR = re.compile(r'REQUEST\s+FOR\s+PRODUCTION', re.IGNORECASE)
+RPD_HEAD = re.compile(r'\s+(?:OF\s+DOCUMENTS\s+)?NO\.\s*(\d+)[:\s]+', re.IGNORECASE)
+# Same language as (?:SPECIAL\s+)?INTERROGATORY\s+NO\. but starting with a
+# character class, so the search can skip ahead instead of trying the
+# optional prefix at every position
+SROG_ANCHOR = re.compile(r'[SI](?:(?<=[Ss])PECIAL\s+INTERROGATORY|(?<=[Ii])NTERROGATORY)\s+NO\.',
+                         re.IGNORECASE)
+NUMBERED_HEAD = re.compile(r'\s*(\d+)[:\s]+')
+# Bare numbers start a line. Anchoring on the newline itself, rather than
+# ^ under MULTILINE, lets the search jump between newlines instead of
+# testing every position. The first line has no newline before it, so this
+# family also treats the text ahead of the first anchor as a chunk.
+BARE_ANCHOR = re.compile(r'\n(?=\d+\.\d+\s)')
+BARE_HEAD = re.compile(r'(\d+\.\d+)\s+')
+
+# Discovery type from filename. Branches are tried in priority order at the
+# start of the name, so one match() call returns the first type that applies.
+DTYPE_RE = re.compile(
+    r"(?=.*(?:rfa|request.*admission))(?P<RFA>)"
+    r"|(?=.*(?:frog|form.*rog|form.*interrog))(?P<FROG>)"
+    r"|(?=.*(?:srog|spec.*rog|special.*interrog))(?P<SROG>)"
+    r"|(?=.*(?:rpd|rfp|request.*production))(?P<RPD>)"
+)
+
+# Completed edit sections in an edits package: type, request number,
+# action and the prose inside the REVISED PROSE fence
+APPLY_RE = re.compile(
+    r'### (\w+) NO\. ([\d.]+) [—–-] (AUGMENT|REWRITE).*?\*\*REVISED PROSE:\*\*\s*```\s*(.*?)\s*```',
+    re.DOTALL)
+
+# Fixed blocks of the edits package, filled with str.format
+EDITS_HEADER = """\
+# DISCOVERY OBJECTIONS - EDITS PACKAGE
+**Generated:** {generated}
+**Working Directory:** `{base_dir}`
+
+---
+
+## INSTRUCTIONS
+
+Draft revised objection prose for each changed request below.
+
+- **AUGMENT:** Add new objection grounds to existing prose
+- **REWRITE:** Start fresh with only currently marked objections
+
+Use the approved templates in `objection_language.txt` as your foundation.
+
+---
+
+"""
+
+# One changed request; blocks are joined with a blank line
+EDITS_CHANGE_BLOCK = """\
+### {type} NO. {request} — {action}
+
+**TEXT:**
+> {text}
+
+{added}{removed}**CURRENT:** {current}
+
+{notes}**REVISED PROSE:**
+```
+[DRAFT HERE]
+```
+
+---
+"""
+
+# File types captured by --snapshot
+SNAPSHOT_SUFFIXES = {".txt", ".csv", ".md"}
+
+# file_hash() results for this run, keyed by (path, mtime_ns, size)
+HASH_CACHE = {}
+
+# Files at least this large are hashed straight from a memory map; smaller
+# ones are read whole, where the mapping setup would cost more than it saves
+HASH_MMAP_MIN = 64 * 1024
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
 def file_hash(path):
-    """Generate SHA-256 hash of file contents."""
-    if not path.exists():
+    """Generate a short hash of file contents, cached per (path, mtime_ns, size)."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return None
-    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    digest = HASH_CACHE.get(key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with path.open("rb", buffering=0) as f:
+            if st.st_size < HASH_MMAP_MIN:
+                hasher.update(f.read())
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+        digest = HASH_CACHE[key] = hasher.hexdigest()[:16]
+    return digest
+
+def hash_files(paths):
+    """Hash several files on a small thread pool; returns {path: hash}."""
+    paths = list(paths)
+    if len(paths) < 2:
+        return {p: file_hash(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return dict(zip(paths, pool.map(file_hash, paths)))
+
+def file_baseline(path, ts):
+    """Baseline entry for a file: its hash plus the size and mtime it had."""
+    st = path.stat()
+    return {"hash": file_hash(path), "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns, "captured_at": ts}
+
+def current_file_hash(path, baseline):
+    """Current hash of a baselined file (None if gone); unchanged size and mtime skip the read."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    if st.st_size == baseline.get("size") and st.st_mtime_ns == baseline.get("mtime_ns"):
+        return baseline["hash"]
+    return file_hash(path)
+
+def tail_lines(path, count, block_size=1 << 16):
+    """Last count lines of a file, read backwards from the end in blocks."""
+    if count <= 0:
+        return []
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        # One extra newline is needed to know the oldest wanted line is whole
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.splitlines()[-count:]
 
 def file_content(path):
     """Read file contents, return None if not exists."""
@@ -58,34 +224,22 @@ def now_iso():
     """Current timestamp in ISO format."""
     return datetime.now().isoformat()
 
+def column_key(col_name):
+    """Casefold a header and collapse whitespace runs, so "Request  No." still matches."""
+    return " ".join(col_name.casefold().split())
+
+def classify_column(col_name):
+    """Classify a matrix header as "request", "notes", or "objection"."""
+    return COLUMN_KINDS.get(column_key(col_name or ""), "objection")
+
 def is_request_column(col_name):
     """Check if column is request number."""
-    if not col_name:
-        return False
-    lower = col_name.strip().lower()
-    return lower in ("request", "req", "no", "no.", "number", "request no", 
-                     "request no.", "interrogatory", "rog", "rfa", "rpd")
-
-def is_notes_column(col_name):
-    """Check if column is notes/comments."""
-    if not col_name:
-        return False
-    lower = col_name.strip().lower()
-    return lower in ("notes", "comments", "note", "comment", "remarks")
+    return classify_column(col_name) == "request"
 
 def detect_discovery_type(filename):
     """Detect discovery type from filename."""
-    name_lower = filename.lower()
-    patterns = [
-        (r"rfa|request.*admission", "RFA"),
-        (r"frog|form.*rog|form.*interrog", "FROG"),
-        (r"srog|spec.*rog|special.*interrog", "SROG"),
-        (r"rpd|rfp|request.*production", "RPD"),
-    ]
-    for pattern, dtype in patterns:
-        if re.search(pattern, name_lower):
-            return dtype
-    return "DISCOVERY"
+    match = DTYPE_RE.match(filename.lower())
+    return match.lastgroup if match else "DISCOVERY"
 
 # =============================================================================
 # FILE DISCOVERY
@@ -95,18 +249,23 @@ def find_discovery_files():
     """Find potential discovery request .txt files."""
     return [f for f in BASE_DIR.glob("*.txt") if f.name.lower() not in SKIP_TXT_FILES]
 
+def read_csv_header(path):
+    """Return the header row of a CSV, reading only its first line when unquoted."""
+    with open(path, newline="", encoding="utf-8-sig") as csvfile:
+        line = csvfile.readline()
+        # Only quoted headers need the csv module
+        if '"' not in line:
+            return tuple(line.rstrip("\r\n").split(",")) if line.strip("\r\n") else ()
+        return tuple(next(csv.reader(chain((line,), csvfile)), ()))
+
 def find_matrix_files():
     """Find CSV files with a Request column."""
     files = []
     for f in BASE_DIR.glob("*.csv"):
         try:
-            with open(f, newline="", encoding="utf-8-sig") as csvfile:
-                reader = csv.DictReader(csvfile)
-                if reader.fieldnames:
-                    for col in reader.fieldnames:
-                        if is_request_column(col):
-                            files.append(f)
-                            break
+            header = read_csv_header(f)
+            if any(is_request_column(col) for col in header):
+                files.append(f)
         except:
             continue
     return files
@@ -118,31 +277,45 @@ def find_final_files():
     responses = list(BASE_DIR.glob("*_responses*.md"))
     return finals + drafts + responses
 
+def clean_stem(path):
+    """Casefolded file stem with separators removed, for name matching."""
+    return path.stem.casefold().translate(STEM_STRIP_TABLE)
+
 def auto_match_pairs():
     """Auto-match discovery files with matrix files."""
     txt_files = find_discovery_files()
     csv_files = find_matrix_files()
     
+    # Clean each name once rather than once per comparison
+    csv_info = []
+    for csv_f in csv_files:
+        csv_base = clean_stem(csv_f)
+        csv_info.append((csv_f, csv_base, set(csv_base)))
+    
     pairs = []
     matched_csvs = set()
     
     for txt in txt_files:
-        txt_base = txt.stem.lower().replace("_", "").replace("-", "").replace(" ", "")
+        txt_base = clean_stem(txt)
+        txt_chars = set(txt_base)
+        # No matrix can score higher than sharing every character plus the substring bonus
+        max_score = len(txt_chars) + 10
         best_match = None
         best_score = 0
         
-        for csv_f in csv_files:
+        for csv_f, csv_base, csv_chars in csv_info:
             if csv_f in matched_csvs:
                 continue
-            csv_base = csv_f.stem.lower().replace("_", "").replace("-", "").replace(" ", "")
             
-            score = len(set(txt_base) & set(csv_base))
+            score = len(txt_chars & csv_chars)
             if txt_base in csv_base or csv_base in txt_base:
                 score += 10
             
             if score > best_score:
                 best_score = score
                 best_match = csv_f
+                if best_score >= max_score:
+                    break
         
         if best_match and best_score > 3:
             pairs.append((txt, best_match))
@@ -158,14 +331,13 @@ def parse_matrix_cell(cell_value):
     """Parse matrix cell. Returns (should_use, notes)."""
     if not cell_value:
         return (False, None)
-    val = str(cell_value).strip()
+    val = cell_value.strip() if isinstance(cell_value, str) else str(cell_value).strip()
     if not val:
         return (False, None)
-    if ";" in val:
-        parts = val.split(";", 1)
-        notes = parts[1].strip() if len(parts) > 1 else None
-        return (True, notes)
-    if val.upper() in ("X", "YES", "Y", "1", "TRUE"):
+    semi = val.find(";")
+    if semi >= 0:
+        return (True, val[semi + 1:].strip())
+    if val in TRUE_MARKER_SPELLINGS or val.upper() in TRUE_MARKERS:
         return (True, None)
     return (True, val)
 
@@ -174,92 +346,148 @@ def parse_matrix(csv_path):
     result = {}
     
     with open(csv_path, newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
         
+        # Rows are read by position; a repeated header name reads its last column
+        col_index = {col: idx for idx, col in enumerate(fieldnames)}
         request_col = None
         notes_col = None
         objection_cols = []
         
         for col in fieldnames:
-            if is_request_column(col):
+            kind = classify_column(col)
+            if kind == "request":
                 request_col = col
-            elif is_notes_column(col):
+            elif kind == "notes":
                 notes_col = col
             else:
-                objection_cols.append(col)
+                objection_cols.append((col, col_index[col]))
         
         if not request_col:
             return result
         
+        request_idx = col_index[request_col]
+        notes_idx = col_index[notes_col] if notes_col else None
+        width = len(fieldnames)
         for row in reader:
-            req_num = (row.get(request_col) or "").strip()
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            req_num = row[request_idx].strip()
             if not req_num:
                 continue
             
             objections = []
-            for col in objection_cols:
-                cell_val = row.get(col, "")
+            for col, idx in objection_cols:
+                cell_val = row[idx]
+                # Most cells are empty; skip them without a call
+                if not cell_val:
+                    continue
                 should_use, cell_notes = parse_matrix_cell(cell_val)
                 if should_use:
                     objections.append({"name": col, "notes": cell_notes})
             
-            notes_val = (row.get(notes_col) or "").strip() if notes_col else ""
+            notes_val = row[notes_idx].strip() if notes_idx is not None else ""
             result[req_num] = {"objections": objections, "notes": notes_val}
     
     return result
 
+def split_requests(content, anchor, head, from_start=False):
+    """Yield (request_num, raw_text) for each anchored chunk whose header matches."""
+    # Chunks run between anchor matches and are never copied out whole; with
+    # from_start the text ahead of the first anchor is a chunk too
+    start = 0 if from_start else None
+    for match in chain(anchor.finditer(content), (None,)):
+        end = match.start() if match else len(content)
+        if start is not None:
+            found = head.match(content, start, end)
+            if found:
+                yield found.group(1), content[found.end():end]
+        start = match.end() if match else None
+
+def keywords_present(content, keywords, block_size=1 << 20):
+    """Lowercase keywords found in ASCII content, lowering one block at a time."""
+    # Blocks overlap so a keyword is never cut in two
+    wanted = set(keywords)
+    found = set()
+    overlap = max(map(len, wanted)) - 1
+    for pos in range(0, len(content), block_size):
+        block = content[pos:pos + block_size + overlap].lower()
+        found.update(k for k in wanted - found if k in block)
+        if found == wanted:
+            break
+    return found
+
+def read_discovery_text(filepath):
+    """Read a discovery file like read_text(), but decode straight from a memory map."""
+    with filepath.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, "utf-8")
+            has_cr = mm.find(b"\r") != -1
+    # Universal newlines, as text-mode reads would give
+    if has_cr:
+        content = content.replace("\r\n", "\n")
+        if "\r" in content:
+            content = content.replace("\r", "\n")
+    return content
+
+def clean_form_rog_text(body):
+    """Form interrogatory text may be quoted; empty ones are dropped."""
+    text = body.rstrip()
+    if text[-1:] in ('"', "'"):
+        text = text[:-1]
+    return text.strip().strip('"\'') or None
+
+def clean_request_text(body):
+    return body.strip()
+
+def clean_bare_text(body):
+    """Bare numbers also match stray figures, so short text is dropped."""
+    text = body.strip()
+    return text if len(text) > 20 else None
+
+# Request families in the order they are tried; the first that yields any
+# request wins. keyword is a lowercase word every header of the family
+# contains (None: always try), clean turns a raw body into the request
+# text, or None to drop it, and from_start is passed to split_requests.
+REQUEST_FAMILIES = (
+    # Form Interrogatory No. X.X (optionally quoted)
+    ("interrogatory", FORM_ROG_ANCHOR, FORM_ROG_HEAD, clean_form_rog_text, False),
+    # REQUEST FOR ADMISSION NO. X
+    ("admission", RFA_ANCHOR, NUMBERED_HEAD, clean_request_text, False),
+    # REQUEST FOR PRODUCTION NO. X
+    ("production", RPD_ANCHOR, RPD_HEAD, clean_request_text, False),
+    # INTERROGATORY NO. X
+    ("interrogatory", SROG_ANCHOR, NUMBERED_HEAD, clean_request_text, False),
+    # Bare X.X at start of line
+    (None, BARE_ANCHOR, BARE_HEAD, clean_bare_text, True),
+)
+
+# Keywords the prefilter in parse_discovery_file looks for
+FAMILY_KEYWORDS = {keyword for keyword, *_ in REQUEST_FAMILIES if keyword}
+
 def parse_discovery_file(filepath):
     """Parse discovery requests from file."""
-    content = filepath.read_text(encoding="utf-8")
-    requests = {}
-    
-    # Pattern 1: Form Interrogatory No. X.X
-    for match in re.finditer(
-        r'Form\s+Interrogatory\s+No\.\s*(\d+\.?\d*)\s*[:\n]?\s*["\']?(.*?)["\']?\s*(?=Form\s+Interrogatory\s+No\.|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        num = match.group(1).strip()
-        text = match.group(2).strip().strip('"\'')
-        if text:
-            requests[num] = text
-    if requests:
-        return requests
-    
-    # Pattern 2: REQUEST FOR ADMISSION NO. X
-    for match in re.finditer(
-        r'REQUEST\s+FOR\s+ADMISSION\s+NO\.\s*(\d+)[:\s]+(.*?)(?=REQUEST\s+FOR\s+ADMISSION\s+NO\.|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        requests[match.group(1)] = match.group(2).strip()
-    if requests:
-        return requests
-    
-    # Pattern 3: REQUEST FOR PRODUCTION NO. X
-    for match in re.finditer(
-        r'REQUEST\s+FOR\s+PRODUCTION\s+(?:OF\s+DOCUMENTS\s+)?NO\.\s*(\d+)[:\s]+(.*?)(?=REQUEST\s+FOR\s+PRODUCTION|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        requests[match.group(1)] = match.group(2).strip()
-    if requests:
-        return requests
-    
-    # Pattern 4: INTERROGATORY NO. X
-    for match in re.finditer(
-        r'(?:SPECIAL\s+)?INTERROGATORY\s+NO\.\s*(\d+)[:\s]+(.*?)(?=(?:SPECIAL\s+)?INTERROGATORY\s+NO\.|$)',
-        content, re.DOTALL | re.IGNORECASE
-    ):
-        requests[match.group(1)] = match.group(2).strip()
-    if requests:
-        return requests
-    
-    # Pattern 5: Bare X.X at start of line
-    for match in re.finditer(r'^(\d+\.\d+)\s+(.*?)(?=^\d+\.\d+\s|\Z)', content, re.MULTILINE | re.DOTALL):
-        text = match.group(2).strip()
-        if len(text) > 20:
-            requests[match.group(1)] = text
-    
-    return requests
+    content = read_discovery_text(filepath)
+    
+    # A substring test is far cheaper than a regex pass, so families whose
+    # keyword never appears are skipped. Only trusted for ASCII text, where
+    # lower() agrees with IGNORECASE matching.
+    present = keywords_present(content, FAMILY_KEYWORDS) if content.isascii() else FAMILY_KEYWORDS
+    
+    for keyword, anchor, head, clean, from_start in REQUEST_FAMILIES:
+        if keyword and keyword not in present:
+            continue
+        requests = {}
+        for num, body in split_requests(content, anchor, head, from_start):
+            request_text = clean(body)
+            if request_text is not None:
+                requests[num] = request_text
+        if requests:
+            return requests
+    return {}
 
 # =============================================================================
 # STATE MANAGEMENT
@@ -272,36 +500,124 @@ def new_state():
         "created": now_iso(),
         "last_updated": now_iso(),
         "baselines": {
-            "files": {},  # {filepath: {"hash": ..., "captured_at": ...}}
+            "files": {},  # {filepath: {"hash", "size", "mtime_ns", "captured_at"}}
         },
         "pairs": {},  # {pair_id: {"discovery": ..., "matrix": ..., "requests": {...}}}
         "history": []
     }
 
 def load_state():
-    """Load state from file."""
-    if not STATE_FILE.exists():
-        return new_state()
+    """Load state from file, or a fresh state if it is missing or unreadable."""
     try:
-        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
-    except:
+        # json decodes the bytes itself; ValueError covers bad JSON and bad UTF-8
+        return json.loads(STATE_FILE.read_bytes())
+    except (OSError, ValueError):
         return new_state()
 
-def save_state(state):
-    """Save state to file."""
+def state_file_mode():
+    """Permission bits for the state file: its current ones, else the umask default."""
+    try:
+        return STATE_FILE.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def archive_history(entries):
+    """Append history entries to HISTORY_LOG, one JSON object per line."""
+    if entries:
+        with HISTORY_LOG.open("ab") as f:
+            f.write("".join(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n"
+                            for entry in entries).encode("utf-8"))
+
+def history_log_count():
+    """Number of entries in HISTORY_LOG."""
+    if not HISTORY_LOG.exists():
+        return 0
+    with HISTORY_LOG.open("rb") as f:
+        return sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+
+def save_state(state, archive=()):
+    """Atomically save state, moving archive and history past HISTORY_LIMIT to HISTORY_LOG."""
     state["last_updated"] = now_iso()
-    STATE_FILE.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    history = state["history"]
+    overflow = history[:-HISTORY_LIMIT] if len(history) > HISTORY_LIMIT else []
+    trimmed = {**state, "history": history[len(overflow):]}
+    if PRETTY_STATE:
+        data = json.dumps(trimmed, indent=2, ensure_ascii=False)
+    else:
+        data = json.dumps(trimmed, separators=(",", ":"), ensure_ascii=False)
+    # Logged before the trimmed state replaces the old one: if the save then
+    # fails the entries are logged again next time, but never lost
+    archive_history(list(archive) + overflow)
+    mode = state_file_mode()
+    tmp = tempfile.NamedTemporaryFile("wb", dir=STATE_FILE.parent, prefix=STATE_FILE.stem,
+                                      suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            tmp.write(data.encode("utf-8"))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # NamedTemporaryFile is owner-only; keep the state file shareable
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, STATE_FILE)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    del history[:len(overflow)]
+
+def matrix_matches_baseline(state, matrix_path):
+    """True if the matrix is byte-identical to the one captured by --init."""
+    baseline = state["baselines"]["files"].get(matrix_path.name)
+    if baseline is None:
+        return False
+    return current_file_hash(matrix_path, baseline) == baseline["hash"]
 
 def get_pair_id(disc_path, matrix_path):
     """Generate unique ID for a discovery/matrix pair."""
     return f"{disc_path.stem}|{matrix_path.stem}"
 
+def objection_delta(current_objs, stored_objs):
+    """Return (added, removed) objection names, each in its list's order."""
+    if current_objs == stored_objs:
+        return [], []
+    # Plain list membership beats building sets for a handful of objections
+    if len(current_objs) + len(stored_objs) > 16:
+        current_set, stored_set = set(current_objs), set(stored_objs)
+    else:
+        current_set, stored_set = current_objs, stored_objs
+    added = [o for o in current_objs if o not in stored_set]
+    removed = [o for o in stored_objs if o not in current_set]
+    return added, removed
+
+def iter_request_changes(pair_id, pair_data, matrix_path):
+    """Yield a change for each request in the current matrix whose objections differ."""
+    stored_requests = pair_data["requests"]
+    for req_num, current_data in parse_matrix(matrix_path).items():
+        current_objs = [o["name"] for o in current_data["objections"]]
+        stored_objs = (stored_requests.get(req_num) or {}).get("objections", ())
+        added, removed = objection_delta(current_objs, stored_objs)
+        
+        if added or removed:
+            yield {
+                "pair_id": pair_id,
+                "type": pair_data["type"],
+                "request": req_num,
+                "added": added,
+                "removed": removed,
+                "current": current_objs,
+                "notes": current_data["notes"],
+                "action": "REWRITE" if removed else "AUGMENT"
+            }
+
 # =============================================================================
 # COMMANDS
 # =============================================================================
 
 def cmd_init():
     """Initialize/reset baseline from current files."""
+    # The history being reset is kept in HISTORY_LOG
+    previous_history = load_state().get("history", [])
     state = new_state()
     ts = now_iso()
     pairs = auto_match_pairs()
@@ -310,24 +626,26 @@ def cmd_init():
     print(f"Found {len(pairs)} discovery/matrix pair(s)")
     print()
     
+    # Hash everything up front; file_baseline() then hits HASH_CACHE
+    hash_files({p for pair in pairs for p in pair} |
+               {p for p in (OBJECTION_LANG_FILE, CASE_SUMMARY_FILE) if p.exists()})
+    
     # Capture file baselines
     for path in [OBJECTION_LANG_FILE, CASE_SUMMARY_FILE]:
         if path.exists():
-            state["baselines"]["files"][str(path.name)] = {
-                "hash": file_hash(path),
-                "captured_at": ts
-            }
+            state["baselines"]["files"][str(path.name)] = file_baseline(path, ts)
     
-    # Process each pair
+    # Process each pair; the per-pair report is written in one go at the end
+    out = []
     for disc_path, matrix_path in pairs:
         pair_id = get_pair_id(disc_path, matrix_path)
         dtype = detect_discovery_type(disc_path.name)
         
-        print(f"  [{dtype}] {disc_path.name} + {matrix_path.name}")
+        out.append(f"  [{dtype}] {disc_path.name} + {matrix_path.name}\n")
         
         # Capture file hashes
-        state["baselines"]["files"][disc_path.name] = {"hash": file_hash(disc_path), "captured_at": ts}
-        state["baselines"]["files"][matrix_path.name] = {"hash": file_hash(matrix_path), "captured_at": ts}
+        state["baselines"]["files"][disc_path.name] = file_baseline(disc_path, ts)
+        state["baselines"]["files"][matrix_path.name] = file_baseline(matrix_path, ts)
         
         # Parse current state
         matrix_data = parse_matrix(matrix_path)
@@ -347,7 +665,8 @@ def cmd_init():
                 "captured_at": ts
             }
         
-        print(f"    {len(matrix_data)} requests captured")
+        out.append(f"    {len(matrix_data)} requests captured\n")
+    sys.stdout.write("".join(out))
     
     # Record in history
     state["history"].append({
@@ -357,7 +676,7 @@ def cmd_init():
         "pair_ids": list(state["pairs"].keys())
     })
     
-    save_state(state)
+    save_state(state, archive=previous_history)
     print()
     print(f"[OK] Baseline saved to {STATE_FILE.name}")
 
@@ -378,7 +697,7 @@ def cmd_check():
     file_changes = []
     for filename, baseline in state["baselines"]["files"].items():
         path = BASE_DIR / filename
-        current_hash = file_hash(path)
+        current_hash = current_file_hash(path, baseline)
         if current_hash != baseline["hash"]:
             file_changes.append((filename, baseline["hash"], current_hash))
     
@@ -390,43 +709,30 @@ def cmd_check():
             print(f"    Current:  {new_h or 'DELETED'}")
         print()
     
-    # Check request changes
+    # Check request changes. A matrix still matching its baseline hash has
+    # nothing to report, so only changed (or unbaselined) matrices are opened.
     all_changes = []
+    changed_files = {fname for fname, _, _ in file_changes}
+    baselined = state["baselines"]["files"]
     for pair_id, pair_data in state["pairs"].items():
+        if pair_data["matrix"] in baselined and pair_data["matrix"] not in changed_files:
+            continue
         matrix_path = BASE_DIR / pair_data["matrix"]
         if not matrix_path.exists():
             print(f"  [!] Matrix file missing: {pair_data['matrix']}")
             continue
         
-        current_matrix = parse_matrix(matrix_path)
-        stored_requests = pair_data["requests"]
-        
-        for req_num, current_data in current_matrix.items():
-            current_objs = set(o["name"] for o in current_data["objections"])
-            stored_objs = set(stored_requests.get(req_num, {}).get("objections", []))
-            
-            added = current_objs - stored_objs
-            removed = stored_objs - current_objs
-            
-            if added or removed:
-                all_changes.append({
-                    "pair_id": pair_id,
-                    "type": pair_data["type"],
-                    "request": req_num,
-                    "added": list(added),
-                    "removed": list(removed),
-                    "current": list(current_objs)
-                })
+        all_changes.extend(iter_request_changes(pair_id, pair_data, matrix_path))
     
     if all_changes:
-        print(f"REQUEST CHANGES ({len(all_changes)}):")
+        out = [f"REQUEST CHANGES ({len(all_changes)}):\n"]
         for c in all_changes:
-            action = "REWRITE" if c["removed"] else "AUGMENT"
-            print(f"  {c['type']} No. {c['request']}: {action}")
+            out.append(f"  {c['type']} No. {c['request']}: {c['action']}\n")
             if c["added"]:
-                print(f"    + {', '.join(c['added'])}")
+                out.append(f"    + {', '.join(c['added'])}\n")
             if c["removed"]:
-                print(f"    - {', '.join(c['removed'])}")
+                out.append(f"    - {', '.join(c['removed'])}\n")
+        sys.stdout.write("".join(out))
         print()
         print("Run --diff to generate edits package.")
     else:
@@ -453,86 +759,36 @@ def cmd_diff():
         
         if not matrix_path.exists():
             continue
+        # An untouched matrix has nothing to revise
+        if matrix_matches_baseline(state, matrix_path):
+            continue
         
-        disc_texts = parse_discovery_file(disc_path) if disc_path.exists() else {}
-        current_matrix = parse_matrix(matrix_path)
-        stored_requests = pair_data["requests"]
+        pair_changes = list(iter_request_changes(pair_id, pair_data, matrix_path))
         
-        for req_num, current_data in current_matrix.items():
-            current_objs = [o["name"] for o in current_data["objections"]]
-            current_obj_set = set(current_objs)
-            stored_objs = set(stored_requests.get(req_num, {}).get("objections", []))
-            
-            added = current_obj_set - stored_objs
-            removed = stored_objs - current_obj_set
-            
-            if added or removed:
-                all_changes.append({
-                    "type": pair_data["type"],
-                    "request": req_num,
-                    "request_text": disc_texts.get(req_num, "[TEXT NOT FOUND]"),
-                    "added": list(added),
-                    "removed": list(removed),
-                    "current": current_objs,
-                    "notes": current_data["notes"],
-                    "action": "REWRITE" if removed else "AUGMENT"
-                })
+        # Only pairs with changes need their request text
+        if pair_changes:
+            disc_texts = parse_discovery_file(disc_path) if disc_path.exists() else {}
+            for c in pair_changes:
+                c["request_text"] = disc_texts.get(c["request"], "[TEXT NOT FOUND]")
+            all_changes.extend(pair_changes)
     
     # Generate package
-    lines = []
-    lines.append("# DISCOVERY OBJECTIONS - EDITS PACKAGE")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Working Directory:** `{BASE_DIR}`")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Instructions
-    lines.append("## INSTRUCTIONS")
-    lines.append("")
-    lines.append("Draft revised objection prose for each changed request below.")
-    lines.append("")
-    lines.append("- **AUGMENT:** Add new objection grounds to existing prose")
-    lines.append("- **REWRITE:** Start fresh with only currently marked objections")
-    lines.append("")
-    lines.append("Use the approved templates in `objection_language.txt` as your foundation.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Changes
+    header = EDITS_HEADER.format(generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                                 base_dir=BASE_DIR)
     if not all_changes:
-        lines.append("## NO CHANGES")
-        lines.append("")
-        lines.append("Everything is in sync.")
+        body = "## NO CHANGES\n\nEverything is in sync."
     else:
-        lines.append(f"## CHANGES ({len(all_changes)})")
-        lines.append("")
-        
-        for c in all_changes:
-            lines.append(f"### {c['type']} NO. {c['request']} — {c['action']}")
-            lines.append("")
-            lines.append("**TEXT:**")
-            lines.append(f"> {c['request_text'][:500]}")
-            lines.append("")
-            if c["added"]:
-                lines.append(f"**ADDED:** {', '.join(c['added'])}")
-            if c["removed"]:
-                lines.append(f"**REMOVED:** {', '.join(c['removed'])}")
-            lines.append(f"**CURRENT:** {', '.join(c['current']) if c['current'] else 'None'}")
-            lines.append("")
-            if c["notes"]:
-                lines.append(f"**NOTES:** {c['notes']}")
-                lines.append("")
-            lines.append("**REVISED PROSE:**")
-            lines.append("```")
-            lines.append("[DRAFT HERE]")
-            lines.append("```")
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-    
-    EDITS_PACKAGE.write_text("\n".join(lines), encoding="utf-8")
+        blocks = (EDITS_CHANGE_BLOCK.format(
+            type=c["type"], request=c["request"], action=c["action"],
+            text=c["request_text"][:500],
+            added=f"**ADDED:** {', '.join(c['added'])}\n" if c["added"] else "",
+            removed=f"**REMOVED:** {', '.join(c['removed'])}\n" if c["removed"] else "",
+            current=', '.join(c['current']) if c['current'] else 'None',
+            notes=f"**NOTES:** {c['notes']}\n\n" if c["notes"] else "",
+        ) for c in all_changes)
+        body = f"## CHANGES ({len(all_changes)})\n\n" + "\n".join(blocks)
+    
+    EDITS_PACKAGE.write_text(header + body, encoding="utf-8")
     
     # Record in history
     state["history"].append({
@@ -557,11 +813,9 @@ def cmd_apply(file_path=None):
     ts = now_iso()
     
     # Parse completed edits
-    pattern = r'### (\w+) NO\. ([\d.]+) [—–-] (AUGMENT|REWRITE).*?\*\*REVISED PROSE:\*\*\s*```\s*(.*?)\s*```'
-    matches = re.findall(pattern, content, re.DOTALL)
-    
     applied = []
-    for dtype, req_num, action, prose in matches:
+    for match in APPLY_RE.finditer(content):
+        dtype, req_num, action, prose = match.groups()
         prose = prose.strip()
         if prose == "[DRAFT HERE]" or not prose:
             continue
@@ -592,10 +846,11 @@ def cmd_snapshot(note=""):
     state = load_state()
     ts = now_iso()
     
-    # Capture current hashes
-    current_hashes = {}
-    for f in list(BASE_DIR.glob("*.txt")) + list(BASE_DIR.glob("*.csv")) + list(BASE_DIR.glob("*.md")):
-        current_hashes[f.name] = file_hash(f)
+    # Capture current hashes (one directory pass for all snapshot types)
+    with os.scandir(BASE_DIR) as entries:
+        paths = [Path(entry.path) for entry in entries
+                 if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SNAPSHOT_SUFFIXES]
+    current_hashes = {p.name: h for p, h in hash_files(paths).items()}
     
     state["history"].append({
         "action": "snapshot",
@@ -628,14 +883,15 @@ def cmd_status():
     print(f"Last Updated: {state.get('last_updated', 'unknown')}")
     print()
     
-    print("PAIRS:")
+    out = ["PAIRS:\n"]
     for pair_id, pair_data in state["pairs"].items():
         req_count = len(pair_data.get("requests", {}))
-        print(f"  [{pair_data['type']}] {pair_data['discovery']} + {pair_data['matrix']}")
-        print(f"       {req_count} requests")
+        out.append(f"  [{pair_data['type']}] {pair_data['discovery']} + {pair_data['matrix']}\n"
+                   f"       {req_count} requests\n")
+    sys.stdout.write("".join(out))
     print()
     
-    print(f"History entries: {len(state.get('history', []))}")
+    print(f"History entries: {history_log_count() + len(state.get('history', []))}")
 
 def cmd_history():
     """Show audit history."""
@@ -646,12 +902,15 @@ def cmd_history():
     print("=" * 60)
     print()
     
-    history = state.get("history", [])
+    history = state.get("history", [])[-20:]  # Show last 20
+    if len(history) < 20 and HISTORY_LOG.exists():
+        # Top up from the spilled entries, reading only the log's tail
+        history = [json.loads(line) for line in tail_lines(HISTORY_LOG, 20 - len(history))] + history
     if not history:
         print("No history.")
         return
     
-    for i, entry in enumerate(history[-20:], 1):  # Show last 20
+    for i, entry in enumerate(history, 1):
         print(f"[{i}] {entry['timestamp'][:19]}")
         print(f"    Action: {entry['action']}")
         
@@ -671,7 +930,9 @@ def cmd_history():
 # =============================================================================
 
 def main():
+    global PRETTY_STATE
     args = sys.argv[1:]
+    PRETTY_STATE = "--pretty" in args
     
     print("=" * 60)
     print("DISCOVERY OBJECTIONS - SMART SYNC v3.1")
@@ -707,6 +968,8 @@ def main():
         print("  --status            Show baseline info")
         print("  --history           Show audit history")
         print()
+        print("Add --pretty to --init, --diff, --apply or --snapshot to save the state file indented.")
+        print()
         print("Workflow:")
         print("  1. Set up your discovery .txt and matrix .csv files")
         print("  2. python smart_sync.py --init")